@@ -5,15 +5,37 @@ Usage:
 """
 
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from src.scraper import rewrite_media_paths
+from src.scraper import rewrite_media_paths_with_index
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
-DATA_DIR = Path(__file__).resolve().parent / "data" / "IMI Wiki"
+DATA_DIR = Path(__file__).parent / "data" / "IMI Wiki"
+
+
+def _build_media_map(root: Path) -> dict[Path, set[str]]:
+    """Walk *root* once and map every media/ directory to its filenames."""
+    media_map: dict[Path, set[str]] = {}
+    for dirpath, _dirnames, filenames in os.walk(root):
+        if Path(dirpath).name == "media":
+            media_map[Path(dirpath)] = set(filenames)
+    return media_map
+
+
+def _patch_one(html_path: Path, media_files: set[str]) -> bool:
+    """Rewrite one HTML file in place; return True if it changed."""
+    original = html_path.read_text(encoding="utf-8")
+    rewritten = rewrite_media_paths_with_index(original, media_files)
+    if rewritten == original:
+        return False
+    html_path.write_text(rewritten, encoding="utf-8")
+    logger.info("Patched: %s", html_path.name)
+    return True
 
 
 def fix_all() -> None:
@@ -24,20 +46,16 @@ def fix_all() -> None:
 
     html_files = sorted(DATA_DIR.rglob("*.html"))
     logger.info("Found %d HTML files to patch", len(html_files))
-    patched = 0
-
-    for html_path in html_files:
-        media_dir = html_path.parent / "media"
-        if not media_dir.exists():
-            continue
 
-        original = html_path.read_text(encoding="utf-8")
-        rewritten = rewrite_media_paths(original, media_dir)
+    # Enumerate every media/ directory once instead of per HTML file
+    media_map = _build_media_map(DATA_DIR)
+    targets = [p for p in html_files if (p.parent / "media") in media_map]
+    file_sets = [media_map[p.parent / "media"] for p in targets]
 
-        if rewritten != original:
-            html_path.write_text(rewritten, encoding="utf-8")
-            patched += 1
-            logger.info("Patched: %s", html_path.name)
+    # chunksize amortizes IPC overhead across many small files
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_patch_one, targets, file_sets, chunksize=32))
+    patched = sum(results)
 
     logger.info("Done — %d/%d files patched", patched, len(html_files))
 
@@ -1,28 +1,46 @@
 """Main controller — entry point for the wiki.js scraper pipeline."""
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from src.config import load_config
 from src.scraper import scrape_wiki
 
-LOGS_DIR = Path(__file__).resolve().parent / "logs"
+LOGS_DIR = Path(__file__).parent / "logs"
 
 
 def _setup_logging() -> None:
-    """Configure root logger to write to stdout and a timestamped log file."""
+    """Configure root logger to write to stdout and a timestamped log file.
+
+    Records pass through a QueueHandler, so the hot scrape path only
+    enqueues; a single listener thread does the actual stdout and file
+    writes off the event loop.
+    """
     LOGS_DIR.mkdir(exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = LOGS_DIR / f"scrape_{ts}.log"
 
     fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    handlers: list[logging.Handler] = [
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(log_file, encoding="utf-8"),
-    ]
-    logging.basicConfig(level=logging.INFO, format=fmt, handlers=handlers)
+    formatter = logging.Formatter(fmt)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    # Plain %(message)s here — the listener's handlers apply the real format
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)]
+    )
+    listener = QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
     logging.getLogger(__name__).info("Log file: %s", log_file)
 
 
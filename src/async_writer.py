@@ -0,0 +1,84 @@
+"""Background artifact writer — queues file writes onto worker threads."""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Byte payloads are flushed to disk in slices of this size
+_CHUNK_SIZE = 64 * 1024
+
+_writer: "AsyncArtifactWriter | None" = None
+
+
+def _write_bytes_chunked(dest: Path, payload: bytes) -> None:
+    """Write *payload* in fixed-size memoryview slices.
+
+    Avoids handing one multi-megabyte buffer to a single write() call for
+    large PDFs/zips and keeps the writer thread responsive between slices.
+    """
+    view = memoryview(payload)
+    with dest.open("wb") as fh:
+        for offset in range(0, len(view), _CHUNK_SIZE):
+            fh.write(view[offset:offset + _CHUNK_SIZE])
+
+
+class AsyncArtifactWriter:
+    """Write scraped artifacts from background threads.
+
+    Callers hand off ``(destination, payload)`` pairs via :meth:`submit` and
+    return immediately; a small pool of worker threads drains the queue and
+    performs the actual ``write_text``/``write_bytes`` calls, hiding disk
+    latency behind ongoing network work.
+    """
+
+    def __init__(self, workers: int = 2) -> None:
+        self._queue: queue.Queue[tuple[Path, bytes | str] | None] = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._drain, daemon=True) for _ in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, dest: Path, payload: bytes | str) -> None:
+        """Queue *payload* (str → UTF-8 text, bytes → raw) for writing to *dest*."""
+        self._queue.put((dest, payload))
+
+    def close(self) -> None:
+        """Flush all pending writes and stop the worker threads."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            dest, payload = item
+            try:
+                if isinstance(payload, str):
+                    dest.write_text(payload, encoding="utf-8")
+                else:
+                    _write_bytes_chunked(dest, payload)
+            except OSError as exc:
+                logger.warning("Failed to write %s: %s", dest, exc)
+
+
+def get_writer() -> AsyncArtifactWriter:
+    """Return the shared writer, starting its worker threads on first use."""
+    global _writer
+    if _writer is None:
+        _writer = AsyncArtifactWriter()
+    return _writer
+
+
+def close_writer() -> None:
+    """Flush and stop the shared writer (no-op if it was never started)."""
+    global _writer
+    if _writer is not None:
+        _writer.close()
+        _writer = None
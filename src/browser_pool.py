@@ -0,0 +1,52 @@
+"""Shared browser pool — launch Chromium once and reuse it across scrape calls."""
+
+import asyncio
+import atexit
+import logging
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+logger = logging.getLogger(__name__)
+
+_pw: Playwright | None = None
+_browser: Browser | None = None
+
+
+async def get_browser() -> Browser:
+    """Return the shared Chromium instance, launching it on first use.
+
+    Long-lived callers (repeated ``scrape_wiki_async`` invocations on one
+    event loop) pay the browser cold-start cost only once.
+    """
+    global _pw, _browser
+    if _browser is None or not _browser.is_connected():
+        _pw = await async_playwright().start()
+        _browser = await _pw.chromium.launch(headless=True)
+        logger.info("Launched shared Chromium instance")
+    return _browser
+
+
+async def close_browser() -> None:
+    """Tear down the shared browser and the Playwright driver behind it."""
+    global _pw, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _pw is not None:
+        await _pw.stop()
+        _pw = None
+        logger.info("Shared Chromium instance closed")
+
+
+def _close_at_exit() -> None:
+    """Best-effort teardown if a caller never closed the pool explicitly."""
+    if _browser is None:
+        return
+    try:
+        asyncio.run(close_browser())
+    except RuntimeError:
+        # Original event loop already gone — the browser process dies with us.
+        pass
+
+
+atexit.register(_close_at_exit)
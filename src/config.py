@@ -7,7 +7,7 @@ from dotenv import dotenv_values
 
 logger = logging.getLogger(__name__)
 
-_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+_ENV_PATH = Path(__file__).parent.parent / ".env"
 
 
 def load_config(env_path: Path = _ENV_PATH) -> dict[str, str]:
@@ -1,46 +1,91 @@
 """Wiki.js content scraper — login, discover pages, download content + media."""
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import os
 import re
+import shutil
+import time
 import urllib.parse
+from collections.abc import AsyncIterator
 from pathlib import Path
 
-from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
+import httpx
+from playwright.async_api import Browser, BrowserContext, Page, Route, StorageState
+
+try:  # C extension — optional, used only to short-circuit media rewrites
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None
+
+from src.async_writer import close_writer, get_writer
+from src.browser_pool import close_browser, get_browser
 
 logger = logging.getLogger(__name__)
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Number of pages saved concurrently (each in its own browser context).
+MAX_WORKERS = 8
+
+# Number of media files fetched concurrently per page.
+MEDIA_CONCURRENCY = 16
+
+# Translation table mapping filesystem-unfriendly characters to underscores
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# Precompiled patterns for the hot per-href / per-attribute paths
+_SKIP_PATH_RE = re.compile(r"^/(_|graphql|healthz|a/)")
+_MEDIA_ATTR_RE = re.compile(r'(src|href)="(/[^"]+)"')
+
+# Selector matching the rendered wiki content container
+_CONTENT_SELECTOR = ".contents, .page-content, #page-content, article, main"
+
+# Raw-HTML equivalents of _CONTENT_SELECTOR for the browserless fast path
+_CONTENT_TAG_RE = re.compile(
+    r'<(?P<tag>[a-zA-Z][a-zA-Z0-9]*)\b[^>]*'
+    r'(?:class="[^"]*(?<![\w-])(?:contents|page-content)(?![\w-])[^"]*"|id="page-content")'
+    r'[^>]*>'
+)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+_IMG_SRC_RE = re.compile(r'<img\b[^>]*\bsrc="([^"]+)"', re.I)
+_DOC_HREF_RE = re.compile(r'href="([^"]+\.(?:pdf|docx|xlsx|pptx|zip|csv))"', re.I)
 
 
 # ---------------------------------------------------------------------------
 # Login
 # ---------------------------------------------------------------------------
 
-def _select_ldap_strategy(page: Page) -> None:
+async def _select_ldap_strategy(page: Page) -> None:
     """Select the 'LDAP / Active Directory' authentication strategy."""
     # wiki.js login page has a strategy picker; click the LDAP option
     strategy_btn = page.locator("text=LDAP / Active Directory")
-    strategy_btn.wait_for(state="visible", timeout=15_000)
-    strategy_btn.click()
+    await strategy_btn.wait_for(state="visible", timeout=15_000)
+    await strategy_btn.click()
     logger.info("Selected LDAP / Active Directory strategy")
 
 
-def login(page: Page, url: str, user: str, password: str) -> None:
+async def login(page: Page, url: str, user: str, password: str) -> None:
     """Navigate to *url*, pick LDAP strategy, fill credentials, submit."""
     logger.info("Navigating to login page: %s", url)
-    page.goto(url, wait_until="networkidle", timeout=30_000)
+    await page.goto(url, wait_until="domcontentloaded", timeout=30_000)
 
-    _select_ldap_strategy(page)
+    await _select_ldap_strategy(page)
 
     # Fill credentials
-    page.fill('input[type="text"], input#loginUsername, input[autocomplete="username"]', user)
-    page.fill('input[type="password"]', password)
+    await page.fill(
+        'input[type="text"], input#loginUsername, input[autocomplete="username"]', user
+    )
+    await page.fill('input[type="password"]', password)
     logger.info("Credentials entered for user=%s", user)
 
     # Click "Anmeldung" button
-    page.click('button:has-text("Anmeldung")')
+    await page.click('button:has-text("Anmeldung")')
     # Wait for navigation away from login page
-    page.wait_for_url(lambda u: "/login" not in u, timeout=30_000)
+    await page.wait_for_url(lambda u: "/login" not in u, timeout=30_000)
     logger.info("Login successful — current URL: %s", page.url)
 
 
@@ -48,76 +93,187 @@ def login(page: Page, url: str, user: str, password: str) -> None:
 # Page discovery
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=16)
 def _base_url(login_url: str) -> str:
     """Derive site base URL from the login URL (strip /login path)."""
     parsed = urllib.parse.urlparse(login_url)
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
-def discover_pages(page: Page, login_url: str) -> list[str]:
-    """Return a sorted, deduplicated list of wiki page URLs.
+# Batch size for cursor-paginated GraphQL discovery
+_DISCOVERY_PAGE_SIZE = 200
+
+# How long cached discovery results stay valid, in seconds
+_DISCOVERY_CACHE_TTL = 3600
+
+_PAGES_QUERY_PAGINATED = (
+    "query ($first: Int!, $after: String) { pages { list(first: $first, after: $after) {"
+    " edges { node { path } } pageInfo { hasNextPage endCursor } } } }"
+)
+_PAGES_QUERY_BULK = "{ pages { list { id path title } } }"
+
+_GRAPHQL_FETCH_JS = """async ({ base, query, variables }) => {
+    const r = await fetch(base + '/graphql', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({ query, variables })
+    });
+    return await r.json();
+}"""
+
+
+async def _graphql(page: Page, base: str, query: str, variables: dict | None = None) -> dict:
+    """Run a GraphQL query against ``/graphql`` using the page's session."""
+    resp: dict = await page.evaluate(
+        _GRAPHQL_FETCH_JS, {"base": base, "query": query, "variables": variables or {}}
+    )
+    return resp
+
+
+async def discover_pages(page: Page, login_url: str) -> AsyncIterator[str]:
+    """Yield deduplicated wiki page URLs as discovery proceeds.
 
     Uses the wiki.js GraphQL API (``/graphql``) which every wiki.js v2
-    instance exposes once authenticated.  Falls back to crawling sidebar
-    links if the API call fails.
+    instance exposes once authenticated, fetching the page list in
+    cursor-paginated batches so URLs stream out while later batches are
+    still in flight.  Falls back to one unpaginated query on servers
+    that reject the cursor arguments, then to crawling sidebar links.
+
+    Results are cached on disk for ``_DISCOVERY_CACHE_TTL`` seconds, so
+    re-runs against the same wiki skip the network round trips entirely.
     """
     base = _base_url(login_url)
-    urls: set[str] = set()
 
-    # --- attempt 1: GraphQL list ---
+    # --- attempt 0: fresh-enough disk cache ---
+    cache_path = _discovery_cache_path(base)
+    cached = _load_discovery_cache(cache_path)
+    if cached is not None:
+        logger.info("Using cached discovery (%d pages) from %s", len(cached), cache_path)
+        for url in cached:
+            yield url
+        return
+
+    seen: set[str] = set()
+    collected: list[str] = []
+    complete = False
+
+    # --- attempt 1: GraphQL list (paginated, bulk fallback inside) ---
     try:
-        resp = page.evaluate(
-            """async (base) => {
-                const r = await fetch(base + '/graphql', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        query: '{ pages { list { id path title } } }'
-                    })
-                });
-                return await r.json();
-            }""",
-            base,
-        )
-        pages_list = resp.get("data", {}).get("pages", {}).get("list", [])
-        for p in pages_list:
-            path = p.get("path", "")
-            if path:
-                urls.add(f"{base}/{path}")
-        if urls:
-            logger.info("GraphQL discovery found %d pages", len(urls))
+        async for path in _iter_graphql_paths(page, base):
+            url = f"{base}/{path}"
+            if url not in seen:
+                seen.add(url)
+                collected.append(url)
+                yield url
+        complete = True
     except Exception:
-        logger.warning("GraphQL page list failed — falling back to link crawl")
+        # Partial results are fine to yield, but not to trust as the full
+        # page list — the link crawl below completes the run instead
+        logger.warning("GraphQL discovery failed after %d pages", len(collected))
+    if complete and seen:
+        logger.info("GraphQL discovery found %d pages", len(seen))
 
     # --- attempt 2: sidebar / anchor crawl ---
-    if not urls:
-        urls = _crawl_sidebar_links(page, base)
+    if not complete or not seen:
+        logger.warning("GraphQL page list %s — falling back to link crawl",
+                       "incomplete" if seen else "failed")
+        for url in sorted(await _crawl_sidebar_links(page, base)):
+            if url not in seen:
+                seen.add(url)
+                collected.append(url)
+                yield url
+
+    # Only a fully successful discovery may be served to later runs
+    if collected:
+        _store_discovery_cache(cache_path, collected)
+    logger.info("Total pages discovered: %d", len(collected))
+
+
+def _discovery_cache_path(base: str) -> Path:
+    """Cache file path for one wiki, keyed by a digest of its base URL."""
+    digest = hashlib.sha256(base.encode()).hexdigest()
+    return DATA_DIR / ".cache" / f"discover_{digest}.json"
+
+
+def _load_discovery_cache(cache_path: Path) -> list[str] | None:
+    """Return cached discovery URLs if still within the TTL, else None."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > _DISCOVERY_CACHE_TTL:
+            return None
+        urls = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return urls if isinstance(urls, list) else None
+
+
+def _store_discovery_cache(cache_path: Path, urls: list[str]) -> None:
+    """Persist discovery URLs; failures only cost the next run a re-fetch."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(urls), encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Could not write discovery cache %s: %s", cache_path, exc)
 
-    sorted_urls = sorted(urls)
-    logger.info("Total pages discovered: %d", len(sorted_urls))
-    return sorted_urls
 
+async def _iter_graphql_paths(page: Page, base: str) -> AsyncIterator[str]:
+    """Yield page paths from the GraphQL API, batch by batch.
 
-def _crawl_sidebar_links(page: Page, base: str) -> set[str]:
+    Raises on query failure so the caller can tell a stream that died
+    mid-pagination from one that ran to exhaustion.
+    """
+    cursor: str | None = None
+    while True:
+        resp = await _graphql(
+            page,
+            base,
+            _PAGES_QUERY_PAGINATED,
+            {"first": _DISCOVERY_PAGE_SIZE, "after": cursor},
+        )
+        if resp.get("errors"):
+            # Server schema without cursor args on pages.list
+            break
+        listing = resp.get("data", {}).get("pages", {}).get("list", {}) or {}
+        for edge in listing.get("edges", []):
+            path = (edge.get("node") or {}).get("path", "")
+            if path:
+                yield path
+        info = listing.get("pageInfo", {})
+        if not info.get("hasNextPage") or not info.get("endCursor"):
+            return
+        cursor = info["endCursor"]
+
+    # --- bulk fallback for schemas without pagination ---
+    resp = await _graphql(page, base, _PAGES_QUERY_BULK)
+    for p in resp.get("data", {}).get("pages", {}).get("list", []) or []:
+        path = p.get("path", "")
+        if path:
+            yield path
+
+
+async def _crawl_sidebar_links(page: Page, base: str) -> set[str]:
     """Extract internal wiki page links from the current page DOM."""
     # Navigate to home first
-    page.goto(base, wait_until="networkidle", timeout=30_000)
-    page.wait_for_timeout(3000)
+    await page.goto(base, wait_until="domcontentloaded", timeout=30_000)
+    try:
+        await page.wait_for_selector("a[href]", timeout=15_000)
+    except Exception:
+        logger.debug("No anchors appeared on %s", base)
 
-    raw_hrefs: list[str] = page.eval_on_selector_all(
+    raw_hrefs: list[str] = await page.eval_on_selector_all(
         "a[href]",
         "els => els.map(e => e.href)",
     )
     internal: set[str] = set()
+    base_netloc = urllib.parse.urlparse(base).netloc
     for href in raw_hrefs:
         parsed = urllib.parse.urlparse(href)
         # keep only same-host, non-login, non-anchor, non-special paths
-        if parsed.netloc and parsed.netloc != urllib.parse.urlparse(base).netloc:
+        if parsed.netloc and parsed.netloc != base_netloc:
             continue
         path = parsed.path.rstrip("/")
         if not path or path in ("/login", "/register", "/favicon.ico"):
             continue
-        if re.match(r"^/(_|graphql|healthz|a/)", path):
+        if _SKIP_PATH_RE.match(path):
             continue
         full = f"{base}{path}"
         internal.add(full)
@@ -129,22 +285,27 @@ def _crawl_sidebar_links(page: Page, base: str) -> set[str]:
 # Content + media download
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=4096)
 def _sanitize_filename(name: str) -> str:
     """Replace filesystem-unfriendly characters."""
-    return re.sub(r'[<>:"/\\|?*]', "_", name).strip()
+    return name.translate(_SANITIZE_TABLE).strip()
 
 
-def save_page(page: Page, url: str, out_dir: Path) -> Path:
+async def save_page(page: Page, url: str, out_dir: Path) -> Path:
     """Save a single wiki page's content and inline media to *out_dir*.
 
     Returns the path to the saved HTML file.
     """
     logger.info("Saving page: %s", url)
-    page.goto(url, wait_until="networkidle", timeout=30_000)
-    page.wait_for_timeout(2000)
+    await page.goto(url, wait_until="domcontentloaded", timeout=30_000)
+    try:
+        await page.wait_for_selector(_CONTENT_SELECTOR, timeout=15_000)
+    except Exception:
+        # No recognizable content container — fall through to full-page snapshot
+        logger.debug("Content selector not found on %s", url)
 
     # Derive a filename from the page title or URL path
-    title = page.title() or urllib.parse.urlparse(url).path.strip("/").replace("/", "_")
+    title = await page.title() or urllib.parse.urlparse(url).path.strip("/").replace("/", "_")
     safe_title = _sanitize_filename(title)
 
     page_dir = out_dir / safe_title
@@ -153,17 +314,18 @@ def save_page(page: Page, url: str, out_dir: Path) -> Path:
     # --- download media (images, PDFs, etc.) ---
     media_dir = page_dir / "media"
     media_dir.mkdir(exist_ok=True)
-    _download_media(page, media_dir)
+    media_files = await _download_media(page, media_dir)
 
     # --- snapshot the HTML content ---
-    content_el = page.query_selector(".contents, .page-content, #page-content, article, main")
-    html = content_el.inner_html() if content_el else page.content()
+    content_el = await page.query_selector(_CONTENT_SELECTOR)
+    html = await content_el.inner_html() if content_el else await page.content()
 
-    # Rewrite media references to point to local media/ folder
-    html = rewrite_media_paths(html, media_dir)
+    # Rewrite media references to point to local media/ folder; use the
+    # filename set directly since the writer may still be flushing to disk
+    html = rewrite_media_paths_with_index(html, media_files)
 
     html_path = page_dir / f"{safe_title}.html"
-    html_path.write_text(html, encoding="utf-8")
+    get_writer().submit(html_path, html)
     logger.info("Saved HTML → %s", html_path)
     return html_path
 
@@ -173,70 +335,360 @@ def rewrite_media_paths(html: str, media_dir: Path) -> str:
 
     For every ``src="/..."`` or ``href="/..."`` whose filename (after URL-decoding)
     matches a file in *media_dir*, the attribute is rewritten to ``media/<filename>``.
+
+    The document is scanned in a single pass; every candidate attribute is
+    checked against the media file set in O(1) and untouched stretches of
+    HTML are copied through verbatim.
     """
-    local_files = {f.name for f in media_dir.iterdir()} if media_dir.exists() else set()
-    if not local_files:
+    # os.scandir reads names straight from the directory entries — no
+    # per-file stat and no Path object churn like iterdir()
+    try:
+        with os.scandir(media_dir) as entries:
+            local_files = {entry.name for entry in entries}
+    except FileNotFoundError:
+        local_files = set()
+    return rewrite_media_paths_with_index(html, local_files)
+
+
+# Cached Aho-Corasick automata, keyed by the media filename set (or None
+# when pre-filtering would be unsound for that set — see below).
+_automaton_cache: dict[frozenset[str], "ahocorasick.Automaton | None"] = {}
+
+
+def _filename_automaton(media_files: frozenset[str]) -> "ahocorasick.Automaton | None":
+    """Build (and cache) a multi-string automaton over *media_files*.
+
+    Returns None when a pre-filter miss would be inconclusive: sanitizing
+    only ever introduces underscores, so a filename without one is
+    guaranteed to appear verbatim in the URL-decoded document whenever a
+    rewrite is possible, but an underscore-containing name may be spelled
+    differently on the page.
+    """
+    if media_files in _automaton_cache:
+        return _automaton_cache[media_files]
+    automaton = None
+    if all("_" not in fname for fname in media_files):
+        automaton = ahocorasick.Automaton()
+        for fname in media_files:
+            automaton.add_word(fname, fname)
+        automaton.make_automaton()
+    if len(_automaton_cache) >= 256:
+        _automaton_cache.clear()
+    _automaton_cache[media_files] = automaton
+    return automaton
+
+
+def rewrite_media_paths_with_index(html: str, media_files: set[str]) -> str:
+    """Like :func:`rewrite_media_paths`, but with a pre-built filename set.
+
+    Lets callers that process many HTML files (e.g. ``fix_media_paths``)
+    enumerate each media directory once instead of per file.
+    """
+    if not media_files:
         return html
 
-    def _replace(m: re.Match[str]) -> str:
-        attr = m.group(1)       # src or href
+    if ahocorasick is not None:
+        automaton = _filename_automaton(frozenset(media_files))
+        if automaton is not None:
+            # One linear sweep for all K filenames at once; most documents
+            # reference none of them and skip the attribute scan entirely
+            haystack = urllib.parse.unquote(html) if "%" in html else html
+            if next(automaton.iter(haystack), None) is None:
+                return html
+
+    parts: list[str] = []
+    last = 0
+    for m in _MEDIA_ATTR_RE.finditer(html):
         raw_path = m.group(2)   # e.g. /screenshots/chart.png
         # Decode URL-encoded characters and grab just the filename
-        decoded = urllib.parse.unquote(raw_path)
-        fname = _sanitize_filename(decoded.split("/")[-1])
-        if fname in local_files:
-            return f'{attr}="media/{fname}"'
-        return m.group(0)
+        decoded = urllib.parse.unquote(raw_path) if "%" in raw_path else raw_path
+        fname = _sanitize_filename(decoded.rsplit("/", 1)[-1])
+        if fname not in media_files:
+            continue
+        parts.append(html[last:m.start()])
+        parts.append(f'{m.group(1)}="media/{fname}"')
+        last = m.end()
+    if not parts:
+        return html
+    parts.append(html[last:])
+    return "".join(parts)
 
-    return re.sub(r'(src|href)="(/[^"]+)"', _replace, html)
 
+# Media URLs already fetched this session, mapped to their first on-disk copy.
+# Shared logos/icons referenced from many pages are fetched once and then
+# hardlinked (or copied) instead of re-downloaded.  No lock needed: the dict
+# is only touched between awaits on the single event loop, and the worst
+# outcome of a concurrent first fetch is one redundant download.
+_downloaded_urls: dict[str, Path] = {}
 
-def _download_media(page: Page, media_dir: Path) -> None:
-    """Download images and linked media files referenced on the page."""
-    base = f"{urllib.parse.urlparse(page.url).scheme}://{urllib.parse.urlparse(page.url).netloc}"
+
+def _media_filename(media_url: str) -> str:
+    """Derive the sanitized local filename for a media URL."""
+    return _sanitize_filename(
+        urllib.parse.unquote(urllib.parse.urlparse(media_url).path.split("/")[-1])
+    )
+
+
+def _reuse_cached_download(media_url: str, dest: Path) -> bool:
+    """Materialize *dest* from an earlier download of *media_url*, if any."""
+    source = _downloaded_urls.get(media_url)
+    if source is None:
+        return False
+    if source == dest or dest.exists():
+        return True
+    if not source.exists():
+        # First copy is still in the writer queue — fetch again this time
+        return False
+    try:
+        os.link(source, dest)
+    except OSError:
+        try:
+            shutil.copyfile(source, dest)
+        except OSError as exc:
+            logger.warning("Could not reuse %s for %s: %s", source, dest, exc)
+            return False
+    return True
+
+
+async def _download_media(page: Page, media_dir: Path) -> set[str]:
+    """Download media files referenced on the page; return their filenames."""
+    parsed_page = urllib.parse.urlparse(page.url)
+    base = f"{parsed_page.scheme}://{parsed_page.netloc}"
 
     # Collect image sources
-    srcs: list[str] = page.eval_on_selector_all(
+    srcs: list[str] = await page.eval_on_selector_all(
         "img[src]",
         "els => els.map(e => e.src)",
     )
     # Collect linked documents (pdf, docx, etc.)
-    hrefs: list[str] = page.eval_on_selector_all(
+    hrefs: list[str] = await page.eval_on_selector_all(
         'a[href$=".pdf"], a[href$=".docx"], a[href$=".xlsx"], '
         'a[href$=".pptx"], a[href$=".zip"], a[href$=".csv"]',
         "els => els.map(e => e.href)",
     )
-    all_urls = set(srcs + hrefs)
-    downloaded = 0
+    media_urls: list[str] = []
+    for media_url in set(srcs + hrefs):
+        if not media_url or media_url.startswith("data:"):
+            continue
+        # Make absolute
+        if media_url.startswith("/"):
+            media_url = base + media_url
+        media_urls.append(media_url)
+
+    semaphore = asyncio.Semaphore(MEDIA_CONCURRENCY)
+
+    async def _fetch_one(media_url: str) -> str | None:
+        fname = _media_filename(media_url)
+        if not fname:
+            return None
+        dest = media_dir / fname
+        if _reuse_cached_download(media_url, dest):
+            return fname
+        async with semaphore:
+            resp = await page.request.get(media_url, timeout=15_000)
+            if not resp.ok:
+                return None
+            body = await resp.body()
+            # Hand the bytes to the background writer; keeps the event loop free
+            get_writer().submit(dest, body)
+            _downloaded_urls.setdefault(media_url, dest)
+            return fname
+
+    results = await asyncio.gather(
+        *(_fetch_one(u) for u in media_urls), return_exceptions=True
+    )
+    return _collect_downloaded(media_urls, results, media_dir)
+
+
+def _collect_downloaded(
+    media_urls: list[str],
+    results: list,
+    media_dir: Path,
+) -> set[str]:
+    """Log per-URL failures from gathered results; return saved filenames."""
+    filenames: set[str] = set()
+    for media_url, result in zip(media_urls, results):
+        if isinstance(result, BaseException):
+            logger.warning("Failed to download %s: %s", media_url, result)
+        elif result:
+            filenames.add(result)
+    logger.info("Downloaded %d media files to %s", len(filenames), media_dir)
+    return filenames
+
+
+# ---------------------------------------------------------------------------
+# Fast path — fetch server-rendered pages without a browser
+# ---------------------------------------------------------------------------
+
+def extract_content_html(html: str) -> str | None:
+    """Return the inner HTML of the wiki content container, or None.
+
+    Finds the first element carrying the wiki.js content class/id and
+    walks same-tag nesting to its closing tag.  A None result means the
+    page needs a browser render; bare ``<article>``/``<main>`` tags are
+    deliberately not treated as containers, since client-rendered SPA
+    shells ship those empty.
+    """
+    m = _CONTENT_TAG_RE.search(html)
+    if m is None:
+        return None
+    tag = m.group("tag").lower()
+    tag_re = re.compile(rf"<(/?){re.escape(tag)}\b[^>]*>", re.I)
+    depth = 1
+    for tm in tag_re.finditer(html, m.end()):
+        if tm.group(1):
+            depth -= 1
+            if depth == 0:
+                return html[m.end():tm.start()]
+        elif not tm.group(0).endswith("/>"):
+            depth += 1
+    return None
+
+
+async def _save_page_fast(client: httpx.AsyncClient, url: str, out_dir: Path) -> Path | None:
+    """Save *url* straight from its server response, skipping the browser.
+
+    Returns the saved HTML path, or None when the response carries no
+    recognizable content container and the Playwright fallback is needed.
+    """
+    resp = await client.get(url)
+    if resp.status_code != 200:
+        return None
+    content = extract_content_html(resp.text)
+    if content is None or not content.strip():
+        # Missing or empty container — the page is client-rendered
+        return None
+
+    title_match = _TITLE_RE.search(resp.text)
+    title = (title_match.group(1).strip() if title_match else "") or urllib.parse.urlparse(
+        url
+    ).path.strip("/").replace("/", "_")
+    safe_title = _sanitize_filename(title)
 
-    for media_url in all_urls:
+    page_dir = out_dir / safe_title
+    page_dir.mkdir(parents=True, exist_ok=True)
+    media_dir = page_dir / "media"
+    media_dir.mkdir(exist_ok=True)
+
+    media_files = await _download_media_fast(client, content, _base_url(url), media_dir)
+    html = rewrite_media_paths_with_index(content, media_files)
+
+    html_path = page_dir / f"{safe_title}.html"
+    get_writer().submit(html_path, html)
+    logger.info("Saved HTML (fast path) → %s", html_path)
+    return html_path
+
+
+async def _download_media_fast(
+    client: httpx.AsyncClient,
+    content_html: str,
+    base: str,
+    media_dir: Path,
+) -> set[str]:
+    """Download media referenced in *content_html* via the shared HTTP client."""
+    candidates = [m.group(1) for m in _IMG_SRC_RE.finditer(content_html)]
+    candidates += [m.group(1) for m in _DOC_HREF_RE.finditer(content_html)]
+
+    media_urls: list[str] = []
+    seen: set[str] = set()
+    for media_url in candidates:
         if not media_url or media_url.startswith("data:"):
             continue
         # Make absolute
         if media_url.startswith("/"):
             media_url = base + media_url
-        try:
-            resp = page.request.get(media_url, timeout=15_000)
-            if resp.ok:
-                fname = _sanitize_filename(
-                    urllib.parse.unquote(urllib.parse.urlparse(media_url).path.split("/")[-1])
-                )
-                if not fname:
-                    continue
-                dest = media_dir / fname
-                dest.write_bytes(resp.body())
-                downloaded += 1
-        except Exception as exc:
-            logger.warning("Failed to download %s: %s", media_url, exc)
-
-    logger.info("Downloaded %d media files to %s", downloaded, media_dir)
+        elif not media_url.startswith(("http://", "https://")):
+            continue
+        if media_url not in seen:
+            seen.add(media_url)
+            media_urls.append(media_url)
+
+    semaphore = asyncio.Semaphore(MEDIA_CONCURRENCY)
+
+    async def _fetch_one(media_url: str) -> str | None:
+        fname = _media_filename(media_url)
+        if not fname:
+            return None
+        dest = media_dir / fname
+        if _reuse_cached_download(media_url, dest):
+            return fname
+        async with semaphore:
+            resp = await client.get(media_url)
+            if resp.status_code != 200:
+                return None
+            get_writer().submit(dest, resp.content)
+            _downloaded_urls.setdefault(media_url, dest)
+            return fname
+
+    results = await asyncio.gather(
+        *(_fetch_one(u) for u in media_urls), return_exceptions=True
+    )
+    return _collect_downloaded(media_urls, results, media_dir)
 
 
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
 
-def scrape_wiki(
+# Resource types the save workers never keep — only the content HTML and
+# image/document downloads matter, so fonts, styles and streams are noise.
+_BLOCKED_RESOURCE_TYPES = {"font", "stylesheet", "media", "websocket"}
+
+
+async def _block_unneeded(route: Route) -> None:
+    """Abort requests for resource types the scraper never persists."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _new_context(
+    browser: Browser,
+    storage_state: StorageState | None = None,
+    block_assets: bool = True,
+) -> BrowserContext:
+    """Create a browser context with the standard scrape settings.
+
+    With *block_assets* (the default for save workers) a route handler
+    aborts fonts, stylesheets, audio/video and websockets, cutting
+    bytes-in-flight and the slow-straggler tail on page loads.  The login
+    context keeps everything so the auth page renders untouched.
+    """
+    context = await browser.new_context(
+        ignore_https_errors=True,
+        viewport={"width": 1280, "height": 900},
+        storage_state=storage_state,
+    )
+    context.set_default_timeout(60_000)
+    context.set_default_navigation_timeout(60_000)
+    if block_assets:
+        await context.route("**/*", _block_unneeded)
+    return context
+
+
+async def _save_one(
+    browser: Browser,
+    client: httpx.AsyncClient,
+    url: str,
+    out_dir: Path,
+    storage_state: StorageState,
+) -> None:
+    """Save one page, trying the browserless fast path before Playwright."""
+    try:
+        if await _save_page_fast(client, url, out_dir) is not None:
+            return
+    except httpx.HTTPError as exc:
+        logger.debug("Fast path failed for %s: %s", url, exc)
+    context = await _new_context(browser, storage_state=storage_state)
+    try:
+        pg = await context.new_page()
+        await save_page(pg, url, out_dir)
+    finally:
+        await context.close()
+
+
+async def scrape_wiki_async(
     login_url: str,
     user: str,
     password: str,
@@ -244,40 +696,97 @@ def scrape_wiki(
 ) -> Path:
     """Full pipeline: login → discover → save all pages + media.
 
+    Discovery and saving run as a pipeline: a producer streams URLs from
+    ``discover_pages`` into a bounded queue while ``MAX_WORKERS`` consumers
+    save them, so the first pages land on disk while discovery is still
+    paginating.  Each consumer reuses the login session via storage state,
+    so only one LDAP round trip happens per run, and the pooled browser
+    stays warm for subsequent calls on the same event loop.
+
     Returns the output directory.
     """
     out_dir = DATA_DIR / wiki_name
     out_dir.mkdir(parents=True, exist_ok=True)
     logger.info("Output directory: %s", out_dir)
 
-    with sync_playwright() as pw:
-        browser: Browser = pw.chromium.launch(headless=True)
-        context: BrowserContext = browser.new_context(
-            ignore_https_errors=True,
-            viewport={"width": 1280, "height": 900},
-        )
-        context.set_default_timeout(60_000)
-        context.set_default_navigation_timeout(60_000)
-        pg: Page = context.new_page()
-
-        login(pg, login_url, user, password)
-
-        urls = discover_pages(pg, login_url)
-        if not urls:
+    browser: Browser = await get_browser()
+    context = await _new_context(browser, block_assets=False)
+    pg: Page = await context.new_page()
+
+    await login(pg, login_url, user, password)
+    # Persist the authenticated session so worker contexts skip LDAP
+    storage_state: StorageState = await context.storage_state()
+    # Share the session with the browserless fast path too
+    cookies = {c["name"]: c["value"] for c in await context.cookies()}
+
+    # Bounded queue gives backpressure if discovery outruns the savers
+    url_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=64)
+    saved = 0
+    failed = 0
+
+    async def _producer() -> int:
+        produced = 0
+        async for url in discover_pages(pg, login_url):
+            await url_queue.put(url)
+            produced += 1
+        if produced == 0:
             logger.warning("No pages discovered — saving home page only")
-            base = _base_url(login_url)
-            urls = [base]
-
-        saved = 0
-        for i, url in enumerate(urls, 1):
+            await url_queue.put(_base_url(login_url))
+            produced = 1
+        for _ in range(MAX_WORKERS):
+            await url_queue.put(None)  # one sentinel per consumer
+        return produced
+
+    async def _consumer(client: httpx.AsyncClient) -> None:
+        nonlocal saved, failed
+        while True:
+            url = await url_queue.get()
+            if url is None:
+                return
             try:
-                save_page(pg, url, out_dir)
+                await _save_one(browser, client, url, out_dir, storage_state)
                 saved += 1
-                logger.info("Progress: %d/%d pages saved", saved, len(urls))
+                logger.info("Progress: %d pages saved", saved)
             except Exception as exc:
-                logger.error("Error saving %s (%d/%d): %s", url, i, len(urls), exc)
-
-        browser.close()
+                failed += 1
+                logger.error("Error saving %s: %s", url, exc)
 
-    logger.info("Scraping complete — %d/%d pages saved to %s", saved, len(urls), out_dir)
+    try:
+        async with httpx.AsyncClient(
+            cookies=cookies, verify=False, timeout=15.0, follow_redirects=True
+        ) as client:
+            consumers = [asyncio.create_task(_consumer(client)) for _ in range(MAX_WORKERS)]
+            total = await _producer()
+            await context.close()
+            await asyncio.gather(*consumers)
+    finally:
+        # Flush queued HTML/media writes to disk even when the pipeline
+        # fails — the daemon writer threads die with the process otherwise
+        close_writer()
+
+    logger.info(
+        "Scraping complete — %d/%d pages saved (%d failed) to %s", saved, total, failed, out_dir
+    )
     return out_dir
+
+
+def scrape_wiki(
+    login_url: str,
+    user: str,
+    password: str,
+    wiki_name: str = "IMI Wiki",
+) -> Path:
+    """Synchronous entry point — runs the async pipeline to completion.
+
+    The pooled browser cannot outlive the event loop created here, so it
+    is closed before returning; long-lived services should call
+    ``scrape_wiki_async`` directly to keep the browser warm between runs.
+    """
+
+    async def _run() -> Path:
+        try:
+            return await scrape_wiki_async(login_url, user, password, wiki_name)
+        finally:
+            await close_browser()
+
+    return asyncio.run(_run())
@@ -0,0 +1,23 @@
+"""Tests for src.async_writer (no network required)."""
+
+from pathlib import Path
+
+from src.async_writer import AsyncArtifactWriter
+
+
+def test_writer_writes_text(tmp_path: Path) -> None:
+    """Text payloads land on disk UTF-8 encoded after close()."""
+    writer = AsyncArtifactWriter()
+    dest = tmp_path / "page.html"
+    writer.submit(dest, "<p>hällo</p>")
+    writer.close()
+    assert dest.read_text(encoding="utf-8") == "<p>hällo</p>"
+
+
+def test_writer_writes_bytes(tmp_path: Path) -> None:
+    """Bytes payloads are written raw after close()."""
+    writer = AsyncArtifactWriter()
+    dest = tmp_path / "chart.png"
+    writer.submit(dest, b"\x89PNG")
+    writer.close()
+    assert dest.read_bytes() == b"\x89PNG"
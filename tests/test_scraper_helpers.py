@@ -2,7 +2,13 @@
 
 from pathlib import Path
 
-from src.scraper import _base_url, _sanitize_filename, rewrite_media_paths
+from src.scraper import (
+    _base_url,
+    _sanitize_filename,
+    extract_content_html,
+    rewrite_media_paths,
+    rewrite_media_paths_with_index,
+)
 
 
 def test_base_url_strips_path() -> None:
@@ -55,3 +61,44 @@ def test_rewrite_media_paths_leaves_unknown(tmp_path: Path) -> None:
     html = '<img src="/missing.png">'
     result = rewrite_media_paths(html, media_dir)
     assert result == html
+
+
+def test_rewrite_media_paths_with_index_uses_given_set() -> None:
+    """The pre-indexed variant rewrites against the passed filename set."""
+    html = '<img src="/screenshots/chart.png"><a href="/docs/other.pdf">x</a>'
+    result = rewrite_media_paths_with_index(html, {"chart.png"})
+    assert result == '<img src="media/chart.png"><a href="/docs/other.pdf">x</a>'
+
+
+def test_rewrite_media_paths_decodes_encoded_src(tmp_path: Path) -> None:
+    """URL-encoded references still match their decoded local filename."""
+    media_dir = tmp_path / "media"
+    media_dir.mkdir()
+    (media_dir / "my chart.png").write_bytes(b"fake")
+
+    html = '<img src="/screenshots/my%20chart.png">'
+    result = rewrite_media_paths(html, media_dir)
+    assert result == '<img src="media/my chart.png">'
+
+
+def test_extract_content_html_by_class() -> None:
+    """The content container is found by its wiki.js class."""
+    html = '<html><body><div class="page-content"><p>hi</p></div></body></html>'
+    assert extract_content_html(html) == "<p>hi</p>"
+
+
+def test_extract_content_html_nested_same_tag() -> None:
+    """Nested elements of the same tag do not truncate the extraction."""
+    html = '<div class="contents"><div>a</div><div>b</div></div><div>after</div>'
+    assert extract_content_html(html) == "<div>a</div><div>b</div>"
+
+
+def test_extract_content_html_missing_returns_none() -> None:
+    """Pages without a content container need a browser render."""
+    assert extract_content_html("<html><body><p>bare</p></body></html>") is None
+
+
+def test_extract_content_html_ignores_bare_spa_shell() -> None:
+    """An unhydrated SPA shell with a bare <main> is not a content hit."""
+    html = '<html><body><main></main><div id="app"></div></body></html>'
+    assert extract_content_html(html) is None